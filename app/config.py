@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import psycopg
 
@@ -22,7 +23,7 @@ def _get_bool(key: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlertJob:
     job_uuid: str
     name: str
@@ -59,22 +60,25 @@ class Settings:
 
 def _parse_recipients(value: str | list[str]) -> tuple[str, ...]:
     if isinstance(value, list):
-        recipients = tuple(str(addr).strip() for addr in value if str(addr).strip())
+        recipients = tuple(filter(None, map(str.strip, map(str, value))))
     else:
-        recipients = tuple(
-            addr.strip() for addr in str(value).split(",") if addr.strip()
-        )
+        recipients = tuple(filter(None, map(str.strip, str(value).split(","))))
     if not recipients:
         raise ValueError("job recipients must contain at least one address")
     return recipients
 
 
+@lru_cache(maxsize=256)
+def _check_crontab(expression: str) -> None:
+    CronTrigger.from_crontab(expression)
+
+
 def _validate_cron_expression(value: str, context: str) -> str:
     expression = value.strip()
     if not expression:
         raise ValueError(f"{context} has invalid schedule_cron")
     try:
-        CronTrigger.from_crontab(expression)
+        _check_crontab(expression)
     except ValueError as exc:
         raise ValueError(
             f"{context} schedule_cron must be a valid 5-field crontab expression"
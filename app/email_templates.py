@@ -19,7 +19,7 @@ def _build_environment(locale: str) -> Environment:
         autoescape=select_autoescape(enabled_extensions=("html", "xml")),
         undefined=StrictUndefined,
         extensions=["jinja2.ext.i18n"],
-        auto_reload=True,
+        auto_reload=False,
     )
 
     translations = gettext.translation(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -41,9 +42,7 @@ def find_threshold_breach(
         return Crossing(timestamp=now, value=current.value, source="current")
 
     horizon = now + timedelta(hours=horizon_hours)
-    for point in forecast_points:
-        if point.timestamp <= now:
-            continue
+    for point in filter_future_forecast_points(forecast_points, now):
         if point.timestamp > horizon:
             break
         if point.value >= limit_cm:
@@ -59,7 +58,9 @@ def find_threshold_breach(
 def filter_future_forecast_points(
     forecast_points: list[Measurement], now: datetime
 ) -> list[Measurement]:
-    return [point for point in forecast_points if point.timestamp > now]
+    # Provider clients return forecast points sorted by timestamp.
+    start = bisect_right(forecast_points, now, key=lambda point: point.timestamp)
+    return forecast_points[start:]
 
 
 def forecast_series_window(
@@ -126,17 +127,16 @@ def evaluate_lifecycle(
         limit_cm=limit_cm,
         horizon_hours=horizon_hours,
     )
-    sorted_forecast = sorted(forecast_points, key=lambda item: item.timestamp)
 
     if current.value >= limit_cm:
         peak_value = current.value
         peak_at = now
-        for point in sorted_forecast:
+        for point in forecast_points:
             if point.value > peak_value:
                 peak_value = point.value
                 peak_at = point.timestamp
         predicted_end_at = next(
-            (point.timestamp for point in sorted_forecast if point.value < limit_cm),
+            (point.timestamp for point in forecast_points if point.value < limit_cm),
             None,
         )
         return LifecycleEvaluation(
@@ -153,7 +153,7 @@ def evaluate_lifecycle(
         )
 
     if crossing is not None:
-        peak_point = max(sorted_forecast, key=lambda p: p.value, default=None)
+        peak_point = max(forecast_points, key=lambda p: p.value, default=None)
         return LifecycleEvaluation(
             state=STATE_CROSSING_INCOMING,
             crossing=crossing,
@@ -6,9 +6,9 @@ from datetime import datetime, timedelta
 from io import BytesIO
 from zoneinfo import ZoneInfo
 
-import matplotlib
 import matplotlib.dates as mdates
-from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter, MultipleLocator
 
 from app.forecasting import forecast_uncertainty_cm
@@ -16,8 +16,6 @@ from app.locale_utils import format_float
 from app.translator import translate
 from app.waterlevel_models import Measurement
 
-matplotlib.use("Agg")
-
 
 def build_forecast_chart_payload(
     historical_points: list[Measurement],
@@ -53,12 +51,14 @@ def build_forecast_chart_payload(
 
     values = [point.value for point in series]
     values.append(limit_cm)
+    band_timestamps: list[datetime] = []
     lower_band: list[float] = []
     upper_band: list[float] = []
     for point in forecast_points:
         uncertainty = forecast_uncertainty_cm(reference_time, point.timestamp)
         if uncertainty is None:
             continue
+        band_timestamps.append(point.timestamp)
         lower_band.append(point.value - uncertainty)
         upper_band.append(point.value + uncertainty)
         values.append(point.value - uncertainty)
@@ -74,7 +74,8 @@ def build_forecast_chart_payload(
         min_value -= padding
         max_value += padding
 
-    fig, ax = plt.subplots(figsize=(10.5, 4.2), dpi=110)
+    fig = Figure(figsize=(10.5, 4.2), dpi=110)
+    ax = fig.subplots()
     fig.patch.set_facecolor("white")
     ax.set_facecolor("white")
 
@@ -155,35 +156,27 @@ def build_forecast_chart_payload(
         )
 
     if lower_band:
-        forecast_with_uncertainty = [
-            point
-            for point in forecast_points
-            if forecast_uncertainty_cm(reference_time, point.timestamp) is not None
-        ]
-        forecast_ts = [point.timestamp for point in forecast_with_uncertainty]
+        band_x = mdates.date2num(band_timestamps)
         ax.fill_between(
-            forecast_ts,
+            band_x,
             lower_band,
             upper_band,
             color="#d9d9d9",
             alpha=0.12,
             zorder=1,
         )
-        ax.plot(
-            forecast_ts,
-            lower_band,
-            color="#b8b8b8",
-            linewidth=1.0,
-            linestyle=(0, (3, 4)),
-            zorder=2,
-        )
-        ax.plot(
-            forecast_ts,
-            upper_band,
-            color="#b8b8b8",
-            linewidth=1.0,
-            linestyle=(0, (3, 4)),
-            zorder=2,
+        ax.add_collection(
+            LineCollection(
+                [
+                    list(zip(band_x, lower_band)),
+                    list(zip(band_x, upper_band)),
+                ],
+                colors="#b8b8b8",
+                linewidths=1.0,
+                linestyles=[(0, (3, 4))],
+                zorder=2,
+            ),
+            autolim=False,
         )
 
     if start_ts <= reference_time <= end_ts:
@@ -251,7 +244,6 @@ def build_forecast_chart_payload(
     fig.tight_layout()
     png_buffer = BytesIO()
     fig.savefig(png_buffer, format="png", dpi=110, bbox_inches="tight")
-    plt.close(fig)
 
     encoded = b64encode(png_buffer.getvalue()).decode("ascii")
     return {
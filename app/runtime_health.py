@@ -30,25 +30,34 @@ class RuntimeHealth:
     jobs: dict[str, JobRuntimeHealth] = field(default_factory=dict)
     startup_complete: bool = False
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _version: int = field(default=0, init=False, repr=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def mark_startup_complete(self) -> None:
         with self._lock:
             self.startup_complete = True
+            self._version += 1
 
     def mark_manager_success(self, now: datetime) -> None:
         with self._lock:
             self.manager_last_success = now
             self.manager_last_error = None
             self.manager_consecutive_failures = 0
+            self._version += 1
 
     def mark_manager_failure(self, now: datetime, error: str) -> None:
         with self._lock:
             self.manager_last_failure = now
             self.manager_last_error = error
             self.manager_consecutive_failures += 1
+            self._version += 1
 
     def upsert_job(self, job_uuid: str, job_name: str) -> None:
         with self._lock:
+            self._version += 1
             existing = self.jobs.get(job_uuid)
             if existing is None:
                 self.jobs[job_uuid] = JobRuntimeHealth(name=job_name)
@@ -57,7 +66,8 @@ class RuntimeHealth:
 
     def remove_job(self, job_uuid: str) -> None:
         with self._lock:
-            self.jobs.pop(job_uuid, None)
+            if self.jobs.pop(job_uuid, None) is not None:
+                self._version += 1
 
     def mark_job_success(self, job_uuid: str, now: datetime) -> bool:
         with self._lock:
@@ -68,6 +78,7 @@ class RuntimeHealth:
             job.last_success = now
             job.last_error = None
             job.consecutive_failures = 0
+            self._version += 1
             return was_degraded
 
     def mark_job_failure(self, job_uuid: str, now: datetime, error: str) -> bool:
@@ -79,63 +90,108 @@ class RuntimeHealth:
             job.last_failure = now
             job.last_error = error
             job.consecutive_failures += 1
+            self._version += 1
             is_degraded = job.consecutive_failures >= self.failure_threshold
             return is_degraded and not was_degraded
 
     def _status_for_failures(self, consecutive_failures: int) -> str:
         return "ok" if consecutive_failures < self.failure_threshold else "degraded"
 
+    def overall_status(self) -> str:
+        with self._lock:
+            return self._overall_status_unlocked()
+
+    def status_of(self, job_uuid: str) -> str:
+        with self._lock:
+            job = self.jobs[job_uuid]
+            if not self.startup_complete:
+                return "starting"
+            return self._status_for_failures(job.consecutive_failures)
+
+    def _overall_status_unlocked(self) -> str:
+        if not self.startup_complete:
+            return "starting"
+        max_failures = max(
+            (job.consecutive_failures for job in self.jobs.values()),
+            default=0,
+        )
+        return self._status_for_failures(
+            max(self.manager_consecutive_failures, max_failures)
+        )
+
     def snapshot(self) -> dict[str, object]:
         with self._lock:
-            status = "starting"
-            manager_status = "starting"
-            jobs_snapshot: dict[str, dict[str, object]] = {}
-            if self.startup_complete:
-                manager_status = self._status_for_failures(
-                    self.manager_consecutive_failures
-                )
-                status = manager_status
-                for job_uuid, job in self.jobs.items():
-                    job_status = self._status_for_failures(job.consecutive_failures)
-                    if job_status == "degraded":
-                        status = "degraded"
-                    jobs_snapshot[job_uuid] = {
-                        "name": job.name,
-                        "status": job_status,
-                        "consecutive_failures": job.consecutive_failures,
-                        "last_success": (
-                            job.last_success.isoformat() if job.last_success else None
-                        ),
-                        "last_failure": (
-                            job.last_failure.isoformat() if job.last_failure else None
-                        ),
-                        "last_error": job.last_error,
-                    }
-            return {
-                "status": status,
-                "started_at": self.started_at.isoformat(),
-                "startup_complete": self.startup_complete,
-                "failure_threshold": self.failure_threshold,
-                "manager": {
-                    "status": manager_status,
-                    "consecutive_failures": self.manager_consecutive_failures,
+            return self._snapshot_unlocked()
+
+    def versioned_snapshot(self) -> tuple[int, dict[str, object]]:
+        with self._lock:
+            return self._version, self._snapshot_unlocked()
+
+    def _snapshot_unlocked(self) -> dict[str, object]:
+        manager_status = "starting"
+        jobs_snapshot: dict[str, dict[str, object]] = {}
+        if self.startup_complete:
+            manager_status = self._status_for_failures(
+                self.manager_consecutive_failures
+            )
+            for job_uuid, job in self.jobs.items():
+                job_status = self._status_for_failures(job.consecutive_failures)
+                jobs_snapshot[job_uuid] = {
+                    "name": job.name,
+                    "status": job_status,
+                    "consecutive_failures": job.consecutive_failures,
                     "last_success": (
-                        self.manager_last_success.isoformat()
-                        if self.manager_last_success
-                        else None
+                        job.last_success.isoformat() if job.last_success else None
                     ),
                     "last_failure": (
-                        self.manager_last_failure.isoformat()
-                        if self.manager_last_failure
-                        else None
+                        job.last_failure.isoformat() if job.last_failure else None
                     ),
-                    "last_error": self.manager_last_error,
-                },
-                "jobs": jobs_snapshot,
-            }
+                    "last_error": job.last_error,
+                }
+        return {
+            "status": self._overall_status_unlocked(),
+            "started_at": self.started_at.isoformat(),
+            "startup_complete": self.startup_complete,
+            "failure_threshold": self.failure_threshold,
+            "manager": {
+                "status": manager_status,
+                "consecutive_failures": self.manager_consecutive_failures,
+                "last_success": (
+                    self.manager_last_success.isoformat()
+                    if self.manager_last_success
+                    else None
+                ),
+                "last_failure": (
+                    self.manager_last_failure.isoformat()
+                    if self.manager_last_failure
+                    else None
+                ),
+                "last_error": self.manager_last_error,
+            },
+            "jobs": jobs_snapshot,
+        }
+
+
+class _HealthBodyCache:
+    def __init__(self, runtime_health: RuntimeHealth) -> None:
+        self._runtime_health = runtime_health
+        self._cached: tuple[int, bytes, bool] | None = None
+
+    def get(self) -> tuple[bytes, bool]:
+        cached = self._cached
+        if cached is not None and cached[0] == self._runtime_health.version:
+            return cached[1], cached[2]
+
+        version, snapshot = self._runtime_health.versioned_snapshot()
+        body = json.dumps(snapshot).encode("utf-8")
+        is_healthy = snapshot["status"] == "ok"
+        self._cached = (version, body, is_healthy)
+        return body, is_healthy
 
 
 def start_health_server(host: str, port: int, runtime_health: RuntimeHealth) -> None:
+    body_cache = _HealthBodyCache(runtime_health)
+
     class HealthHandler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:  # noqa: N802
             if self.path != "/health":
@@ -145,9 +201,7 @@ def start_health_server(host: str, port: int, runtime_health: RuntimeHealth) ->
                 self.wfile.write(b"not found")
                 return
 
-            snapshot = runtime_health.snapshot()
-            is_healthy = snapshot["status"] == "ok"
-            body = json.dumps(snapshot).encode("utf-8")
+            body, is_healthy = body_cache.get()
 
             self.send_response(200 if is_healthy else 503)
             self.send_header("Content-Type", "application/json")
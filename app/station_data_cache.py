@@ -23,6 +23,7 @@ class StationDataCache(Generic[T]):
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._cache: dict[tuple[str, str, int], T] = {}
+        self._keys_by_bucket: dict[int, set[tuple[str, str, int]]] = {}
         self._inflight: dict[tuple[str, str, int], _InFlight[T]] = {}
 
     @staticmethod
@@ -93,6 +94,7 @@ class StationDataCache(Generic[T]):
         with self._lock:
             inflight.result = result
             self._cache[key] = result
+            self._keys_by_bucket.setdefault(bucket, set()).add(key)
             self._prune_cache_unlocked(current_bucket=bucket)
             inflight.event.set()
             self._inflight.pop(key, None)
@@ -100,6 +102,9 @@ class StationDataCache(Generic[T]):
 
     def _prune_cache_unlocked(self, current_bucket: int) -> None:
         keep_from = current_bucket - 1
-        stale_keys = [key for key in self._cache if key[2] < keep_from]
-        for key in stale_keys:
-            self._cache.pop(key, None)
+        stale_buckets = [
+            bucket for bucket in self._keys_by_bucket if bucket < keep_from
+        ]
+        for bucket in stale_buckets:
+            for key in self._keys_by_bucket.pop(bucket):
+                self._cache.pop(key, None)
@@ -14,6 +14,10 @@ from docker.errors import APIError, NotFound
 
 logger = logging.getLogger("hochwasser-watchdog")
 
+EVENT_FILTERS = {"type": "container", "event": ["die", "health_status"]}
+RECONNECT_DELAY_INITIAL_SECONDS = 1.0
+RECONNECT_DELAY_MAX_SECONDS = 60.0
+
 
 def _bool_env(key: str, default: bool) -> bool:
     raw = os.getenv(key)
@@ -39,7 +43,7 @@ class WatchdogSettings:
     smtp_use_starttls: bool
     smtp_use_ssl: bool
     recipients: tuple[str, ...]
-    watch_containers: tuple[str, ...]
+    watch_containers: frozenset[str]
     cooldown_seconds: int
     auto_restart_unhealthy: bool
 
@@ -53,7 +57,7 @@ def load_settings() -> WatchdogSettings:
         raise ValueError("WATCHDOG_ALERT_RECIPIENTS must not be empty")
 
     watch_raw = os.getenv("WATCHDOG_WATCH_CONTAINERS", "")
-    watch_containers = tuple(
+    watch_containers = frozenset(
         name.strip() for name in watch_raw.split(",") if name.strip()
     )
 
@@ -101,7 +105,7 @@ def _login_if_needed(server: smtplib.SMTP, settings: WatchdogSettings) -> None:
         server.login(settings.smtp_username, settings.smtp_password)
 
 
-def _matches_watchlist(container_name: str, watch_containers: tuple[str, ...]) -> bool:
+def _matches_watchlist(container_name: str, watch_containers: frozenset[str]) -> bool:
     if not watch_containers:
         return True
     return container_name in watch_containers
@@ -126,17 +130,21 @@ def main() -> None:
     settings = load_settings()
     logger.info(
         "Watchdog started, watch_containers=%s, auto_restart_unhealthy=%s, cooldown=%ds",
-        ",".join(settings.watch_containers) if settings.watch_containers else "all",
+        ",".join(sorted(settings.watch_containers))
+        if settings.watch_containers
+        else "all",
         settings.auto_restart_unhealthy,
         settings.cooldown_seconds,
     )
 
     client = docker.from_env()
     last_alert_sent: dict[str, float] = {}
+    reconnect_delay = RECONNECT_DELAY_INITIAL_SECONDS
 
     while True:
         try:
-            for event in client.events(decode=True):
+            for event in client.events(decode=True, filters=EVENT_FILTERS):
+                reconnect_delay = RECONNECT_DELAY_INITIAL_SECONDS
                 if event.get("Type") != "container":
                     continue
 
@@ -177,7 +185,7 @@ def main() -> None:
                     )
                     continue
 
-                timestamp = datetime.now(timezone.utc).isoformat()
+                timestamp = datetime.fromtimestamp(now_ts, tz=timezone.utc).isoformat()
                 subject = f"[Hochwasser Watchdog] {container_name} {notify_type} at {timestamp}"
                 body = (
                     f"Container: {container_name}\n"
@@ -190,8 +198,13 @@ def main() -> None:
                 last_alert_sent[alert_key] = now_ts
                 logger.warning("Alert sent for %s (%s)", container_name, notify_type)
         except Exception as exc:  # noqa: BLE001
-            logger.exception("Docker event stream error: %s", exc)
-            time.sleep(5)
+            logger.exception(
+                "Docker event stream error, reconnecting in %.0fs: %s",
+                reconnect_delay,
+                exc,
+            )
+            time.sleep(reconnect_delay)
+            reconnect_delay = min(RECONNECT_DELAY_MAX_SECONDS, reconnect_delay * 2)
 
 
 if __name__ == "__main__":
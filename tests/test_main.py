@@ -1,6 +1,9 @@
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from app.config import AlertJob
 from app.email_content import build_email
 from app.forecasting import (
@@ -18,6 +21,30 @@ from app.state_store import (
 )
 from app.waterlevel_models import Measurement, StationInfo
 
+_NOW = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+_FORECAST_WINDOW_START = datetime(2026, 2, 20, 7, 0, tzinfo=timezone.utc)
+_UTC_ZONE = ZoneInfo("UTC")
+_STUB_CHART_PAYLOAD: dict[str, str | None] = {
+    "image_data_uri": "data:image/png;base64,iVBORw0KGgo=",
+    "alt": "Hydrograph",
+    "legend": None,
+    "message": None,
+}
+_BASE_STATION = StationInfo(
+    uuid="station-1",
+    number="12345",
+    shortname="TEST",
+    longname="TEST STATION",
+    km=12.3,
+    agency="WSA TEST",
+    longitude=10.1,
+    latitude=52.5,
+    water_shortname="ELBE",
+    water_longname="ELBE",
+    unit="cm",
+    timeseries=(),
+)
+
 
 def make_job(locale: str = "en", limit_cm: float = 100.0) -> AlertJob:
     return AlertJob(
@@ -34,7 +61,7 @@ def make_job(locale: str = "en", limit_cm: float = 100.0) -> AlertJob:
 
 
 def test_find_threshold_breach_uses_call_time_for_current() -> None:
-    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    now = _NOW
     current = Measurement(timestamp=now - timedelta(minutes=5), value=105.0)
 
     crossing = find_threshold_breach(
@@ -51,7 +78,7 @@ def test_find_threshold_breach_uses_call_time_for_current() -> None:
 
 
 def test_find_threshold_breach_from_forecast() -> None:
-    now = datetime.now(tz=timezone.utc)
+    now = _NOW
     current = Measurement(timestamp=now, value=90.0)
     forecast = [
         Measurement(timestamp=now + timedelta(hours=2), value=95.0),
@@ -72,7 +99,7 @@ def test_find_threshold_breach_from_forecast() -> None:
 
 
 def test_find_threshold_breach_ignores_non_future_points() -> None:
-    now = datetime.now(tz=timezone.utc)
+    now = _NOW
     current = Measurement(timestamp=now, value=90.0)
     forecast = [
         Measurement(timestamp=now - timedelta(minutes=10), value=120.0),
@@ -94,7 +121,7 @@ def test_find_threshold_breach_ignores_non_future_points() -> None:
 
 
 def test_filter_future_forecast_points() -> None:
-    now = datetime.now(tz=timezone.utc)
+    now = _NOW
     forecast = [
         Measurement(timestamp=now - timedelta(minutes=10), value=99.0),
         Measurement(timestamp=now, value=100.0),
@@ -107,19 +134,9 @@ def test_filter_future_forecast_points() -> None:
 
 
 def test_forecast_horizon_hours_from_metadata() -> None:
-    now = datetime(2026, 2, 20, 7, 0, tzinfo=timezone.utc)
-    station = StationInfo(
-        uuid="station-1",
-        number="12345",
-        shortname="TEST",
-        longname="TEST STATION",
-        km=12.3,
-        agency="WSA TEST",
-        longitude=10.1,
-        latitude=52.5,
-        water_shortname="ELBE",
-        water_longname="ELBE",
-        unit="cm",
+    now = _FORECAST_WINDOW_START
+    station = replace(
+        _BASE_STATION,
         timeseries=(
             {
                 "shortname": "WV",
@@ -133,27 +150,14 @@ def test_forecast_horizon_hours_from_metadata() -> None:
 
 
 def test_forecast_horizon_hours_zero_when_series_missing() -> None:
-    now = datetime(2026, 2, 20, 7, 0, tzinfo=timezone.utc)
-    station = StationInfo(
-        uuid="station-1",
-        number="12345",
-        shortname="TEST",
-        longname="TEST STATION",
-        km=12.3,
-        agency="WSA TEST",
-        longitude=10.1,
-        latitude=52.5,
-        water_shortname="ELBE",
-        water_longname="ELBE",
-        unit="cm",
-        timeseries=(),
-    )
+    now = _FORECAST_WINDOW_START
+    station = _BASE_STATION
 
     assert forecast_horizon_hours_from_station(now, station, "WV") == 0
 
 
 def test_evaluate_lifecycle_incoming() -> None:
-    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    now = _NOW
     current = Measurement(timestamp=now, value=95.0)
     forecast = [
         Measurement(timestamp=now + timedelta(minutes=30), value=99.0),
@@ -173,7 +177,7 @@ def test_evaluate_lifecycle_incoming() -> None:
 
 
 def test_evaluate_lifecycle_active_and_soon_over() -> None:
-    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    now = _NOW
     current = Measurement(timestamp=now, value=105.0)
     forecast = [Measurement(timestamp=now + timedelta(hours=2), value=99.0)]
 
@@ -198,7 +202,7 @@ def test_evaluate_lifecycle_active_and_soon_over() -> None:
 
 
 def test_evaluate_lifecycle_no_crossing() -> None:
-    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    now = _NOW
     current = Measurement(timestamp=now, value=95.0)
 
     lifecycle = evaluate_lifecycle(
@@ -214,21 +218,10 @@ def test_evaluate_lifecycle_no_crossing() -> None:
 
 def test_build_email_includes_station_details_and_forecast_table() -> None:
     job = make_job(locale="en", limit_cm=100.0)
-    zone = ZoneInfo("UTC")
-    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
-    station = StationInfo(
-        uuid="station-1",
-        number="12345",
-        shortname="TEST",
-        longname="TEST STATION",
-        km=12.3,
-        agency="WSA TEST",
-        longitude=10.1,
-        latitude=52.5,
-        water_shortname="ELBE",
-        water_longname="ELBE",
-        unit="cm",
-        timeseries=({"shortname": "W"}, {"shortname": "WV"}),
+    zone = _UTC_ZONE
+    now = _NOW
+    station = replace(
+        _BASE_STATION, timeseries=({"shortname": "W"}, {"shortname": "WV"})
     )
     current = Measurement(timestamp=now, value=90.0)
     forecast_points = [
@@ -265,23 +258,16 @@ def test_build_email_includes_station_details_and_forecast_table() -> None:
     assert "<strong style='color:#b00020'>101.0 cm</strong>" in html_body
 
 
-def test_build_email_localized_german() -> None:
+def test_build_email_localized_german(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "app.email_content.build_forecast_chart_payload",
+        lambda *_args: _STUB_CHART_PAYLOAD,
+    )
     job = make_job(locale="de", limit_cm=100.0)
-    zone = ZoneInfo("UTC")
-    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
-    station = StationInfo(
-        uuid="station-1",
-        number="12345",
-        shortname="TEST",
-        longname="TEST STATION",
-        km=12.3,
-        agency="WSA TEST",
-        longitude=10.1,
-        latitude=52.5,
-        water_shortname="ELBE",
-        water_longname="ELBE",
-        unit="cm",
-        timeseries=({"shortname": "W"}, {"shortname": "WV"}),
+    zone = _UTC_ZONE
+    now = _NOW
+    station = replace(
+        _BASE_STATION, timeseries=({"shortname": "W"}, {"shortname": "WV"})
     )
     current = Measurement(timestamp=now, value=90.0)
     forecast_points = [
@@ -2,23 +2,31 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from app.pegelonline import PegelonlineClient
 
+_FIRST_FORECAST_AT = datetime(2026, 2, 20, 10, 0, tzinfo=timezone.utc)
+
 
-def test_get_official_forecast_returns_empty_on_primary_404() -> None:
+def test_get_official_forecast_returns_empty_on_primary_404(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     client = PegelonlineClient("station-1", forecast_series_shortname="WV")
 
     def fake_get_json(endpoint: str):
         raise RuntimeError(f"HTTP 404 for https://example.invalid{endpoint}")
 
-    client._get_json = fake_get_json  # type: ignore[method-assign]
+    monkeypatch.setattr(client, "_get_json", fake_get_json)
 
     forecast = client.get_official_forecast()
 
     assert forecast == []
 
 
-def test_get_official_forecast_parses_primary_series() -> None:
+def test_get_official_forecast_parses_primary_series(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     client = PegelonlineClient("station-1", forecast_series_shortname="WV")
 
     def fake_get_json(endpoint: str):
@@ -28,10 +36,10 @@ def test_get_official_forecast_parses_primary_series() -> None:
             {"timestamp": "2026-02-20T10:00:00+00:00", "value": 99.0},
         ]
 
-    client._get_json = fake_get_json  # type: ignore[method-assign]
+    monkeypatch.setattr(client, "_get_json", fake_get_json)
 
     forecast = client.get_official_forecast()
 
     assert len(forecast) == 2
-    assert forecast[0].timestamp == datetime(2026, 2, 20, 10, 0, tzinfo=timezone.utc)
+    assert forecast[0].timestamp == _FIRST_FORECAST_AT
     assert forecast[1].value == 101.0
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from app.plotting import build_forecast_chart_payload
+from app.waterlevel_models import Measurement
+
+_NOW = datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc)
+_BERLIN_ZONE = ZoneInfo("Europe/Berlin")
+
+
+def _chart_inputs() -> tuple[list[Measurement], Measurement, list[Measurement]]:
+    historical_points = [
+        Measurement(timestamp=_NOW - timedelta(hours=hours), value=300.0 + hours)
+        for hours in range(24, 0, -1)
+    ]
+    current = Measurement(timestamp=_NOW, value=305.0)
+    forecast_points = [
+        Measurement(timestamp=_NOW + timedelta(hours=hours), value=305.0 + hours)
+        for hours in range(1, 73)
+    ]
+    return historical_points, current, forecast_points
+
+
+def test_chart_depends_on_exact_reference_time() -> None:
+    historical_points, current, forecast_points = _chart_inputs()
+
+    def render(reference_time: datetime) -> dict[str, str | None]:
+        return build_forecast_chart_payload(
+            historical_points=historical_points,
+            current=current,
+            forecast_points=forecast_points,
+            reference_time=reference_time,
+            limit_cm=340.0,
+            unit="cm",
+            zone=_BERLIN_ZONE,
+            locale="de",
+        )
+
+    payload = render(_NOW)
+
+    assert payload["image_data_uri"] is not None
+    assert render(_NOW) == payload
+    # Every job run passes its own datetime.now() as the reference time, which
+    # moves the "now" marker and the uncertainty bands, so a cache keyed on the
+    # chart inputs would never see the same key twice.
+    assert render(_NOW + timedelta(minutes=30)) != payload
@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
 
-from app.runtime_health import RuntimeHealth
+from app.runtime_health import RuntimeHealth, _HealthBodyCache
+
+_STARTED_AT = datetime(2026, 2, 22, 10, 0, tzinfo=timezone.utc)
+_NOW = datetime(2026, 2, 22, 10, 5, tzinfo=timezone.utc)
 
 
 def _new_health() -> RuntimeHealth:
     health = RuntimeHealth(
-        started_at=datetime(2026, 2, 22, 10, 0, tzinfo=timezone.utc),
+        started_at=_STARTED_AT,
         failure_threshold=2,
     )
     health.mark_startup_complete()
@@ -14,29 +17,25 @@ def _new_health() -> RuntimeHealth:
 
 def test_runtime_health_tracks_jobs_independently() -> None:
     health = _new_health()
-    now = datetime(2026, 2, 22, 10, 5, tzinfo=timezone.utc)
 
     health.upsert_job("job-a", "Job A")
     health.upsert_job("job-b", "Job B")
-    health.mark_job_failure("job-a", now=now, error="api timeout")
-    health.mark_job_failure("job-a", now=now, error="api timeout")
-    health.mark_job_success("job-b", now=now)
-
-    snapshot = health.snapshot()
+    health.mark_job_failure("job-a", now=_NOW, error="api timeout")
+    health.mark_job_failure("job-a", now=_NOW, error="api timeout")
+    health.mark_job_success("job-b", now=_NOW)
 
-    assert snapshot["status"] == "degraded"
-    assert snapshot["jobs"]["job-a"]["status"] == "degraded"
-    assert snapshot["jobs"]["job-b"]["status"] == "ok"
+    assert health.overall_status() == "degraded"
+    assert health.status_of("job-a") == "degraded"
+    assert health.status_of("job-b") == "ok"
 
 
 def test_manager_success_does_not_clear_job_failure() -> None:
     health = _new_health()
-    now = datetime(2026, 2, 22, 10, 10, tzinfo=timezone.utc)
 
     health.upsert_job("job-a", "Job A")
-    health.mark_job_failure("job-a", now=now, error="smtp error")
-    health.mark_job_failure("job-a", now=now, error="smtp error")
-    health.mark_manager_success(now=now)
+    health.mark_job_failure("job-a", now=_NOW, error="smtp error")
+    health.mark_job_failure("job-a", now=_NOW, error="smtp error")
+    health.mark_manager_success(now=_NOW)
 
     snapshot = health.snapshot()
 
@@ -47,16 +46,33 @@ def test_manager_success_does_not_clear_job_failure() -> None:
 
 def test_removing_degraded_job_recovers_global_status() -> None:
     health = _new_health()
-    now = datetime(2026, 2, 22, 10, 15, tzinfo=timezone.utc)
 
-    health.mark_manager_success(now=now)
+    health.mark_manager_success(now=_NOW)
     health.upsert_job("job-a", "Job A")
-    health.mark_job_failure("job-a", now=now, error="x")
-    health.mark_job_failure("job-a", now=now, error="x")
-    assert health.snapshot()["status"] == "degraded"
+    health.mark_job_failure("job-a", now=_NOW, error="x")
+    health.mark_job_failure("job-a", now=_NOW, error="x")
+    assert health.overall_status() == "degraded"
 
     health.remove_job("job-a")
     snapshot = health.snapshot()
 
-    assert snapshot["status"] == "ok"
+    assert health.overall_status() == "ok"
     assert "job-a" not in snapshot["jobs"]
+
+
+def test_health_body_cache_reuses_body_until_state_changes() -> None:
+    health = _new_health()
+    cache = _HealthBodyCache(health)
+
+    health.upsert_job("job-a", "Job A")
+    body, is_healthy = cache.get()
+    assert is_healthy
+    assert cache.get()[0] is body
+
+    health.mark_job_failure("job-a", now=_NOW, error="x")
+    health.mark_job_failure("job-a", now=_NOW, error="x")
+    degraded_body, is_healthy = cache.get()
+
+    assert not is_healthy
+    assert degraded_body is not body
+    assert b'"degraded"' in degraded_body
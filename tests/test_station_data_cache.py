@@ -90,3 +90,30 @@ def test_different_keys_fetch_independently() -> None:
     t2.join(timeout=2)
 
     assert sorted(out) == ["a", "b"]
+
+
+def test_stale_buckets_are_pruned_on_insert() -> None:
+    cache: StationDataCache[str] = StationDataCache()
+    first = datetime(2026, 2, 24, 10, 0, tzinfo=timezone.utc)
+    later = datetime(2026, 2, 24, 10, 5, tzinfo=timezone.utc)
+
+    for station_uuid in ("station-a", "station-b"):
+        cache.get_or_fetch(
+            now=first,
+            station_uuid=station_uuid,
+            forecast_series_shortname="WV",
+            requester="[job=t]",
+            fetcher=lambda: "old",
+        )
+
+    result = cache.get_or_fetch(
+        now=later,
+        station_uuid="station-a",
+        forecast_series_shortname="WV",
+        requester="[job=t]",
+        fetcher=lambda: "new",
+    )
+
+    assert result == "new"
+    assert list(cache._cache) == [("station-a", "WV", cache._minute_bucket(later))]
+    assert list(cache._keys_by_bucket) == [cache._minute_bucket(later)]